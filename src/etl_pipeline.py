@@ -9,26 +9,135 @@ Author: Teja Vamshidhar Reddy
 Date: 2024
 """
 
+import io
 import os
 import sys
+import atexit
+import queue
+import uuid
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine
-from typing import Optional, Dict, Any
+from sqlalchemy import URL, create_engine, event, text
+from typing import Optional, Dict, Any, Iterator, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; fall back to the pandas parser
+    pa = None
+    pacsv = None
+    pq = None
+
+try:
+    import numexpr
+except ImportError:  # numexpr is optional; pandas evaluates expressions in Python
+    numexpr = None
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional; transform uses pandas
+    pl = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; transform falls back to pandas
+    njit = None
+
+# Configure logging; file writes happen on a background listener thread
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(
+    log_queue,
+    logging.FileHandler('logs/pipeline.log'),
+    respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
 
-# Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('logs/pipeline.log'),
+        QueueHandler(log_queue),
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Rows serialized per COPY round trip; PostgreSQL throughput plateaus around here
+COPY_CHUNK_ROWS = 100_000
+
+# Streaming run: Arrow CSV block size, and rows per chunk for the pandas
+# and Parquet readers (about one block of the transaction schema)
+CSV_BLOCK_BYTES = 64 << 20
+STREAM_CHUNK_ROWS = 1_000_000
+
+# Narrow dtypes for known columns, applied at extract time. Integer columns
+# are parsed with the default dtype (nullable dtypes slow pandas' CSV parser
+# several times over, and forced types reject input such as 1.0) and
+# narrowed by transform once nulls are removed.
+COLUMN_DTYPES = {
+    'product_id': 'category',
+    'store_id': 'category'
+}
+INTEGER_COLUMNS = ('transaction_id', 'quantity')
+
+
+def _narrow_integers(values: pd.Series) -> pd.Series:
+    """
+    Narrow a numeric column to int32, or int64 when out of int32 range, if
+    every value is a whole number; otherwise return it unchanged.
+    """
+    if (values.empty or pd.api.types.is_bool_dtype(values)
+            or not pd.api.types.is_numeric_dtype(values) or values.isna().any()):
+        return values
+    
+    low, high = values.min(), values.max()
+    if pd.api.types.is_float_dtype(values):
+        # Floats beyond 2**53 no longer hold exact integers
+        data = values.to_numpy(dtype=np.float64)
+        if not (-2**53 <= low and high <= 2**53 and (np.trunc(data) == data).all()):
+            return values
+    
+    int32 = np.iinfo(np.int32)
+    dtype = np.int32 if int32.min <= low and high <= int32.max else np.int64
+    if isinstance(values.dtype, pd.ArrowDtype):
+        return values.astype(pd.ArrowDtype(pa.from_numpy_dtype(dtype)))
+    return values.astype(dtype)
+
+
+def _arrow_to_pandas(table):
+    """
+    Convert an Arrow table to pandas, keeping Arrow-backed columns and
+    turning dictionary columns into pandas categoricals.
+    """
+    # Arrow infers date-only columns as date32; cast them to timestamps, as
+    # pandas' parse_dates does, rather than leave transform a slow to_datetime
+    for i, field in enumerate(table.schema):
+        if pa.types.is_date(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.timestamp('us')))
+    return table.to_pandas(
+        types_mapper=lambda t: None if pa.types.is_dictionary(t) else pd.ArrowDtype(t)
+    )
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _total_and_positive(quantity, price, out_total, out_mask):
+        """
+        Compute quantity * price and the quantity/price > 0 mask in one pass.
+        """
+        for i in prange(quantity.size):
+            out_total[i] = quantity[i] * price[i]
+            out_mask[i] = (quantity[i] > 0) & (price[i] > 0)
+else:
+    _total_and_positive = None
+
 
 class RetailETLPipeline:
     """
@@ -52,6 +161,15 @@ class RetailETLPipeline:
         self.start_time = None
         self.end_time = None
         
+        # Copy-on-Write lets transform share column buffers with its input
+        # (always on, and the option deprecated, from pandas 3.0)
+        if int(pd.__version__.split('.')[0]) < 3:
+            pd.set_option('mode.copy_on_write', True)
+        
+        # Let DataFrame.eval/query use every core, up to numexpr's thread limit
+        if numexpr is not None:
+            numexpr.set_num_threads(min(os.cpu_count() or 1, numexpr.MAX_THREADS))
+        
         # Create logs directory if it doesn't exist
         Path('logs').mkdir(exist_ok=True)
         
@@ -70,8 +188,17 @@ class RetailETLPipeline:
             'db_name': os.getenv('DB_NAME', 'retail_db'),
             'db_user': os.getenv('DB_USER', 'postgres'),
             'db_password': os.getenv('DB_PASSWORD', ''),
+            'db_options': os.getenv(
+                'DB_OPTIONS', '-c synchronous_commit=off -c work_mem=256MB'
+            ),
             'input_path': os.getenv('INPUT_PATH', 'data/'),
-            'batch_size': int(os.getenv('BATCH_SIZE', '1000'))
+            'batch_size': int(os.getenv('BATCH_SIZE', '1000')),
+            'use_copy': os.getenv('USE_COPY', 'true').lower() == 'true',
+            'fast_io': os.getenv('FAST_IO', 'true').lower() == 'true',
+            'columns': os.getenv('COLUMNS').split(',') if os.getenv('COLUMNS') else None,
+            'use_polars': os.getenv('USE_POLARS', 'false').lower() == 'true',
+            'stream': os.getenv('STREAM', 'true').lower() == 'true',
+            'load_workers': int(os.getenv('LOAD_WORKERS', '4'))
         }
     
     def connect_database(self) -> bool:
@@ -82,11 +209,28 @@ class RetailETLPipeline:
             True if connection successful, False otherwise
         """
         try:
-            connection_string = (
-                f"postgresql://{self.config['db_user']}:{self.config['db_password']}"
-                f"@{self.config['db_host']}:{self.config['db_port']}/{self.config['db_name']}"
+            # URL.create escapes credentials containing reserved characters
+            url = URL.create(
+                'postgresql+psycopg2',
+                username=self.config['db_user'],
+                password=self.config['db_password'],
+                host=self.config['db_host'],
+                port=int(self.config['db_port']),
+                database=self.config['db_name']
+            )
+            # Fallback INSERT path: batch executemany round trips with psycopg2.
+            # The pool holds one connection per concurrent COPY worker.
+            # With synchronous_commit=off, COMMIT does not wait for the WAL
+            # flush; a server crash can lose the latest commits, never corrupt data.
+            self.engine = create_engine(
+                url,
+                connect_args={'options': self.config.get('db_options', '')},
+                executemany_mode='values_plus_batch',
+                executemany_batch_page_size=500,
+                insertmanyvalues_page_size=10000,
+                pool_size=max(1, self.config.get('load_workers', 4)),
+                max_overflow=0
             )
-            self.engine = create_engine(connection_string)
             logger.info("Database connection established")
             return True
         except Exception as e:
@@ -106,10 +250,25 @@ class RetailETLPipeline:
         logger.info(f"Starting data extraction from {source_path}")
         
         try:
-            if source_path.endswith('.csv'):
-                df = pd.read_csv(source_path)
+            columns = self.config.get('columns')
+            fast_io = pacsv is not None and self.config.get('fast_io', True)
+            
+            if source_path.endswith('.parquet'):
+                df = pd.read_parquet(source_path, engine='pyarrow', columns=columns)
+            elif source_path.endswith('.csv'):
+                # Reuse a Parquet copy of the CSV while it is newer than the source
+                cache_path = source_path + '.parquet'
+                if fast_io and self._cache_is_fresh(source_path, cache_path):
+                    logger.info(f"Reading cached Parquet copy {cache_path}")
+                    df = _arrow_to_pandas(pq.read_table(cache_path, columns=columns))
+                else:
+                    df = self._read_csv(source_path, fast_io)
+                    if fast_io:
+                        self._write_parquet_cache(df, cache_path)
+                    if columns:
+                        df = df[columns]
             elif source_path.endswith('.xlsx'):
-                df = pd.read_excel(source_path)
+                df = pd.read_excel(source_path, dtype=COLUMN_DTYPES, usecols=columns)
             else:
                 raise ValueError(f"Unsupported file format: {source_path}")
             
@@ -120,6 +279,83 @@ class RetailETLPipeline:
             logger.error(f"Error during extraction: {str(e)}")
             raise
     
+    def _write_parquet_cache(self, df: pd.DataFrame, cache_path: str) -> None:
+        """
+        Save a parsed CSV as Parquet, best-effort; extraction never fails over it.
+        
+        Args:
+            df: Parsed CSV data
+            cache_path: Destination of the Parquet copy
+        """
+        # Write under a temporary name so a failed write never leaves a partial
+        # file that later runs would take for a fresh cache
+        tmp_path = cache_path + '.tmp'
+        try:
+            df.to_parquet(tmp_path, engine='pyarrow', index=False)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not write Parquet cache {cache_path}: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _cache_is_fresh(self, source_path: str, cache_path: str) -> bool:
+        """
+        Check whether a Parquet copy exists and is newer than its CSV source.
+        
+        Args:
+            source_path: Path to the CSV file
+            cache_path: Path to its Parquet copy
+        
+        Returns:
+            True if the Parquet copy can be read instead of the CSV
+        """
+        return (os.path.exists(cache_path)
+                and os.path.getmtime(cache_path) >= os.path.getmtime(source_path))
+    
+    def _arrow_csv_options(self) -> Tuple[Any, Any]:
+        """
+        Build the PyArrow CSV read and convert options with categorical columns.
+        
+        Returns:
+            Tuple of (ReadOptions, ConvertOptions)
+        """
+        category = pa.dictionary(pa.int32(), pa.string())
+        read_options = pacsv.ReadOptions(block_size=CSV_BLOCK_BYTES, use_threads=True)
+        convert_options = pacsv.ConvertOptions(
+            # Other types are inferred, as pd.read_csv does: forcing int32 or a
+            # timestamp type would reject 1.0, large ids or non-ISO dates
+            column_types={
+                'product_id': category,
+                'store_id': category
+            },
+            # Blank string cells are missing values, as with pd.read_csv
+            strings_can_be_null=True
+        )
+        return read_options, convert_options
+    
+    def _read_csv(self, source_path: str, fast_io: bool) -> pd.DataFrame:
+        """
+        Parse a CSV file with narrowed column types.
+        
+        Args:
+            source_path: Path to the CSV file
+            fast_io: Use the multi-threaded PyArrow parser instead of pandas
+        
+        Returns:
+            DataFrame containing raw data
+        """
+        if not fast_io:
+            return pd.read_csv(source_path, dtype=COLUMN_DTYPES, parse_dates=['date'])
+        
+        # Multi-threaded Arrow parser, keeping Arrow-backed columns
+        read_options, convert_options = self._arrow_csv_options()
+        table = pacsv.read_csv(
+            source_path,
+            read_options=read_options,
+            convert_options=convert_options
+        )
+        return _arrow_to_pandas(table)
+    
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Transform and clean the raw data.
@@ -133,36 +369,55 @@ class RetailETLPipeline:
         logger.info("Starting data transformation")
         
         try:
-            # Create a copy to avoid modifying original
-            df_clean = df.copy()
-            
-            # Remove duplicates
-            initial_count = len(df_clean)
-            df_clean = df_clean.drop_duplicates()
-            logger.info(f"Removed {initial_count - len(df_clean)} duplicate records")
+            if pl is not None and self.config.get('use_polars', False):
+                df_clean = self._transform_polars(df)
+                logger.info(
+                    f"Transformation complete. {len(df_clean)} records ready for loading"
+                )
+                return df_clean
             
-            # Handle missing values
-            df_clean = df_clean.dropna(subset=['transaction_id', 'date'])
+            # Build one row mask: duplicate transaction ids, missing keys and
+            # invalid records (non-positive quantities or prices)
+            duplicated = df.duplicated(subset=['transaction_id'], keep='first').to_numpy()
+            logger.info(f"Removed {duplicated.sum()} duplicate records")
+            mask = ~duplicated & df[['transaction_id', 'date']].notna().all(axis=1).to_numpy()
             
-            # Convert date column to datetime
-            if 'date' in df_clean.columns:
-                df_clean['date'] = pd.to_datetime(df_clean['date'])
+            numeric_columns = [col for col in ('quantity', 'price') if col in df.columns]
+            total_amount = None
+            if len(numeric_columns) == 2 and _total_and_positive is not None:
+                # JIT kernel derives total_amount and the positivity mask together;
+                # missing values become NaN, which fails the > 0 check
+                quantity = df['quantity'].to_numpy(dtype=np.float64, na_value=np.nan)
+                price = df['price'].to_numpy(dtype=np.float64, na_value=np.nan)
+                total_amount = np.empty(quantity.size, dtype=np.float64)
+                positive = np.empty(quantity.size, dtype=np.bool_)
+                _total_and_positive(quantity, price, total_amount, positive)
+                mask &= positive
+            else:
+                for col in numeric_columns:
+                    mask &= df[col].gt(0).to_numpy(dtype=bool, na_value=False)
             
-            # Calculate derived fields
-            if 'quantity' in df_clean.columns and 'price' in df_clean.columns:
-                df_clean['total_amount'] = df_clean['quantity'] * df_clean['price']
+            # Indexing returns a new frame, so the input is never modified. When
+            # every row is valid a shallow copy avoids materializing the rows;
+            # Copy-on-Write keeps later column assignments off the input.
+            keep_all = bool(mask.all())
+            df_clean = df.copy(deep=False) if keep_all else df[mask]
             
-            # Data type conversions
-            numeric_columns = ['quantity', 'price']
-            for col in numeric_columns:
-                if col in df_clean.columns:
-                    df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
+            self._convert_types(df_clean)
             
-            # Remove invalid records (negative quantities or prices)
-            if 'quantity' in df_clean.columns:
-                df_clean = df_clean[df_clean['quantity'] > 0]
-            if 'price' in df_clean.columns:
-                df_clean = df_clean[df_clean['price'] > 0]
+            # Calculate derived fields
+            if total_amount is not None:
+                df_clean['total_amount'] = total_amount if keep_all else total_amount[mask]
+            elif len(numeric_columns) == 2:
+                # numexpr only handles NumPy-backed columns
+                use_numexpr = numexpr is not None and all(
+                    isinstance(dtype, np.dtype) for dtype in df_clean[numeric_columns].dtypes
+                )
+                df_clean.eval(
+                    'total_amount = quantity * price',
+                    engine='numexpr' if use_numexpr else 'python',
+                    inplace=True
+                )
             
             logger.info(f"Transformation complete. {len(df_clean)} records ready for loading")
             return df_clean
@@ -171,6 +426,57 @@ class RetailETLPipeline:
             logger.error(f"Error during transformation: {str(e)}")
             raise
     
+    def _convert_types(self, df_clean: pd.DataFrame) -> None:
+        """
+        Parse dates and narrow integer columns of cleaned rows in place.
+        
+        Args:
+            df_clean: DataFrame without duplicate, missing or invalid records
+        """
+        # Convert date column to datetime unless extract already parsed it
+        if ('date' in df_clean.columns
+                and not pd.api.types.is_datetime64_any_dtype(df_clean['date'])):
+            df_clean['date'] = pd.to_datetime(df_clean['date'])
+        
+        # Narrow integer keys now that missing values are gone; fractional
+        # or out-of-range values keep their parsed dtype
+        for col in INTEGER_COLUMNS:
+            if col in df_clean.columns:
+                df_clean[col] = _narrow_integers(df_clean[col])
+    
+    def _transform_polars(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Run the transform steps as a single optimized Polars lazy query.
+        
+        Args:
+            df: Raw DataFrame
+        
+        Returns:
+            Cleaned and transformed DataFrame
+        """
+        lf = pl.from_pandas(df).lazy()
+        schema = lf.collect_schema()
+        
+        lf = (
+            lf.unique(subset=['transaction_id'], keep='first', maintain_order=True)
+            .drop_nulls(['transaction_id', 'date'])
+        )
+        
+        if 'quantity' in schema and 'price' in schema:
+            lf = lf.with_columns((pl.col('quantity') * pl.col('price')).alias('total_amount'))
+        
+        # Null quantities or prices fail the filter, as in the pandas path
+        conditions = [pl.col(col) > 0 for col in ('quantity', 'price') if col in schema]
+        if conditions:
+            lf = lf.filter(*conditions)
+        
+        # Dates and integer columns get the pandas path's conversions, so both
+        # paths produce the same column types; a null transaction_id would
+        # otherwise leave the key as float64
+        df_clean = lf.collect(engine='streaming').to_pandas()
+        self._convert_types(df_clean)
+        return df_clean
+    
     def load(self, df: pd.DataFrame, table_name: str, if_exists: str = 'append') -> bool:
         """
         Load transformed data into the database.
@@ -189,20 +495,12 @@ class RetailETLPipeline:
             if self.engine is None:
                 raise RuntimeError("Database connection not established")
             
-            # Load data in batches
-            batch_size = self.config['batch_size']
-            total_batches = len(df) // batch_size + (1 if len(df) % batch_size else 0)
-            
-            for i in range(0, len(df), batch_size):
-                batch = df.iloc[i:i + batch_size]
-                batch.to_sql(
-                    table_name,
-                    self.engine,
-                    if_exists=if_exists if i == 0 else 'append',
-                    index=False
-                )
-                batch_num = i // batch_size + 1
-                logger.info(f"Loaded batch {batch_num}/{total_batches}")
+            if if_exists == 'replace' and self._use_copy():
+                self._copy_replace(df, table_name)
+            else:
+                # One transaction: a failed load leaves no rows behind
+                with self.engine.begin() as conn:
+                    self._write_rows(conn, df, table_name, if_exists)
             
             logger.info(f"Successfully loaded {len(df)} records to '{table_name}'")
             return True
@@ -211,6 +509,206 @@ class RetailETLPipeline:
             logger.error(f"Error during loading: {str(e)}")
             return False
     
+    def _use_copy(self) -> bool:
+        """
+        Check whether rows are loaded with COPY instead of INSERT statements.
+        
+        Returns:
+            True for PostgreSQL targets unless COPY is disabled
+        """
+        return self.engine.dialect.name == 'postgresql' and self.config.get('use_copy', True)
+    
+    def _write_rows(
+        self, conn: Any, df: pd.DataFrame, table_name: str, if_exists: str = 'append'
+    ) -> None:
+        """
+        Write DataFrame rows inside the caller's transaction.
+        
+        Args:
+            conn: SQLAlchemy connection with an open transaction
+            df: Cleaned DataFrame to load
+            table_name: Target table name
+            if_exists: How to behave if table exists ('append', 'replace', 'fail')
+        """
+        # PostgreSQL: stream rows through COPY instead of INSERT statements
+        if self._use_copy():
+            # Let pandas create the table schema if needed; COPY only moves rows
+            df.head(0).to_sql(table_name, conn, if_exists=if_exists, index=False)
+            self._copy_rows(df, table_name, conn)
+            return
+        
+        # Otherwise: let pandas batch multi-row INSERTs
+        batch_size = self.config['batch_size']
+        total_batches = -(-len(df) // batch_size)
+        batch_num = 0
+        
+        def log_batch(conn, cursor, statement, parameters, context, executemany):
+            nonlocal batch_num
+            if statement.lstrip().upper().startswith('INSERT'):
+                batch_num += 1
+                logger.info(f"Loaded batch {batch_num}/{total_batches}")
+        
+        event.listen(conn, 'after_cursor_execute', log_batch)
+        try:
+            df.to_sql(
+                table_name,
+                conn,
+                if_exists=if_exists,
+                index=False,
+                chunksize=batch_size,
+                method='multi'
+            )
+        finally:
+            event.remove(conn, 'after_cursor_execute', log_batch)
+    
+    def _copy_replace(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Replace a PostgreSQL table with a DataFrame using COPY FROM STDIN.
+        
+        Args:
+            df: Cleaned DataFrame to load
+            table_name: Target table name
+        """
+        quote = self.engine.dialect.identifier_preparer.quote
+        
+        # Copy into an unlogged staging table without per-row WAL, then swap
+        # it in so the old table stays intact until the load has succeeded
+        # A per-load name keeps concurrent replace runs apart; it comes first
+        # so identifier truncation never drops it, and an existing table with
+        # the name is never overwritten
+        staging_name = f"staging_{uuid.uuid4().hex[:12]}_{table_name}"
+        df.head(0).to_sql(staging_name, self.engine, if_exists='fail', index=False)
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {quote(staging_name)} SET UNLOGGED"))
+            
+            # A failure drops the whole staging table, so chunks may commit
+            # independently on concurrent connections
+            self._copy_rows(df, staging_name)
+            
+            with self.engine.begin() as conn:
+                conn.execute(text(f"DROP TABLE IF EXISTS {quote(table_name)}"))
+                conn.execute(text(f"ALTER TABLE {quote(staging_name)} SET LOGGED"))
+                conn.execute(text(
+                    f"ALTER TABLE {quote(staging_name)} RENAME TO {quote(table_name)}"
+                ))
+        except Exception:
+            with self.engine.begin() as conn:
+                conn.execute(text(f"DROP TABLE IF EXISTS {quote(staging_name)}"))
+            raise
+    
+    def _copy_rows(
+        self, df: pd.DataFrame, table_name: str, conn: Optional[Any] = None
+    ) -> None:
+        """
+        Copy DataFrame rows into an existing table in chunks.
+        
+        Args:
+            df: Rows to copy
+            table_name: Target table name
+            conn: SQLAlchemy connection whose transaction receives every chunk;
+                without one, chunks are copied on parallel pooled connections,
+                each committing on its own
+        """
+        # PyArrow writes NULL as an unquoted empty field (PostgreSQL's CSV
+        # default) and quotes strings; the pandas writer marks NULL with \N.
+        # Frames Arrow cannot type, such as object columns mixing numbers and
+        # strings from read_excel, go through the pandas writer.
+        schema = None
+        if pa is not None and self.config.get('fast_io', True):
+            try:
+                schema = pa.Schema.from_pandas(df, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                logger.info(f"Serializing COPY data with pandas: {str(e)}")
+        null_option = '' if schema is not None else ", NULL '\\N'"
+        
+        quote = self.engine.dialect.identifier_preparer.quote
+        columns = ', '.join(quote(str(col)) for col in df.columns)
+        copy_sql = (
+            f"COPY {quote(table_name)} ({columns}) "
+            f"FROM STDIN WITH (FORMAT CSV{null_option})"
+        )
+        
+        row_count = len(df)
+        chunk_size = COPY_CHUNK_ROWS
+        total_chunks = -(-row_count // chunk_size)
+        workers = max(1, min(self.config.get('load_workers', 4), total_chunks))
+        
+        if conn is not None:
+            # The caller's transaction commits or rolls back every chunk at once
+            cursor = conn.connection.cursor()
+            try:
+                for i in range(0, row_count, chunk_size):
+                    buf = self._serialize_chunk(df.iloc[i:i + chunk_size], schema)
+                    cursor.copy_expert(copy_sql, buf)
+                    logger.info(f"Copied chunk {i // chunk_size + 1}/{total_chunks}")
+            finally:
+                cursor.close()
+            return
+        
+        # psycopg2 releases the GIL during network I/O, so disjoint chunks can be
+        # copied concurrently; each chunk commits on its own pooled connection
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._copy_chunk, copy_sql, df.iloc[i:i + chunk_size], schema
+                )
+                for i in range(0, row_count, chunk_size)
+            ]
+            for chunk_num, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                logger.info(f"Copied chunk {chunk_num}/{total_chunks}")
+    
+    def _serialize_chunk(self, chunk: pd.DataFrame, schema: Optional[Any]) -> io.IOBase:
+        """
+        Serialize rows as headerless CSV for COPY FROM STDIN.
+        
+        Args:
+            chunk: Rows to serialize
+            schema: Arrow schema of the rows for the PyArrow CSV writer, or None
+                to serialize with pandas
+        
+        Returns:
+            Buffer positioned at the start of the CSV data
+        """
+        if schema is not None:
+            # Columnar C++ writer; no per-row Python dispatch
+            buf = io.BytesIO()
+            pacsv.write_csv(
+                pa.Table.from_pandas(chunk, schema=schema, preserve_index=False),
+                buf,
+                write_options=pacsv.WriteOptions(include_header=False, quoting_style='needed')
+            )
+        else:
+            buf = io.StringIO()
+            chunk.to_csv(buf, index=False, header=False, na_rep='\\N')
+        buf.seek(0)
+        return buf
+    
+    def _copy_chunk(self, copy_sql: str, chunk: pd.DataFrame, schema: Optional[Any]) -> None:
+        """
+        Copy one chunk of rows over a pooled connection and commit it.
+        
+        Args:
+            copy_sql: COPY ... FROM STDIN statement for the target table
+            chunk: Rows to copy
+            schema: Arrow schema of the rows for the PyArrow CSV writer, or None
+                to serialize with pandas
+        """
+        buf = self._serialize_chunk(chunk, schema)
+        
+        conn = self.engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.copy_expert(copy_sql, buf)
+            cursor.close()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+    
     def run(self, source_path: str, target_table: str = 'fact_transactions') -> bool:
         """
         Execute the complete ETL pipeline.
@@ -234,14 +732,21 @@ class RetailETLPipeline:
             if not self.connect_database():
                 return False
             
-            # Step 2: Extract
-            raw_data = self.extract(source_path)
-            
-            # Step 3: Transform
-            clean_data = self.transform(raw_data)
-            
-            # Step 4: Load
-            success = self.load(clean_data, target_table)
+            if source_path.endswith('.csv') and self.config.get('stream', True):
+                # Steps 2-4: Extract, transform and load one chunk at a time
+                records = self._run_chunked(source_path, target_table)
+                success = True
+            else:
+                # Step 2: Extract
+                raw_data = self.extract(source_path)
+                
+                # Step 3: Transform (the raw frame is not needed afterwards)
+                clean_data = self.transform(raw_data)
+                del raw_data
+                
+                # Step 4: Load
+                success = self.load(clean_data, target_table)
+                records = len(clean_data)
             
             self.end_time = datetime.now()
             duration = (self.end_time - self.start_time).total_seconds()
@@ -250,7 +755,7 @@ class RetailETLPipeline:
                 logger.info("=" * 50)
                 logger.info("ETL Pipeline Completed Successfully")
                 logger.info(f"Duration: {duration:.2f} seconds")
-                logger.info(f"Records processed: {len(clean_data)}")
+                logger.info(f"Records processed: {records}")
                 logger.info("=" * 50)
             
             return success
@@ -259,6 +764,142 @@ class RetailETLPipeline:
             logger.error(f"Pipeline failed: {str(e)}")
             return False
     
+    def _run_chunked(self, source_path: str, target_table: str) -> int:
+        """
+        Stream a CSV source through transform and load in fixed-size chunks.
+        
+        Every chunk is written in one transaction, so a failure part-way
+        through leaves no rows behind and the run can simply be repeated.
+        
+        Args:
+            source_path: Path to the source CSV file
+            target_table: Name of target database table
+        
+        Returns:
+            Number of records loaded
+        """
+        # Transaction ids from earlier chunks, so duplicates are removed
+        # across the whole file; the set grows with each chunk's new ids
+        seen_ids = set()
+        records = 0
+        
+        chunks = self._iter_csv_chunks(source_path)
+        try:
+            with self.engine.begin() as conn:
+                for chunk_num, chunk in enumerate(chunks, start=1):
+                    logger.info(f"Processing chunk {chunk_num} ({len(chunk)} rows)")
+                    ids = chunk['transaction_id']
+                    present = ids.notna().to_numpy(dtype=bool)
+                    values = ids[present].tolist()
+                    repeated = np.zeros(len(chunk), dtype=bool)
+                    repeated[present] = np.fromiter(
+                        map(seen_ids.__contains__, values), dtype=bool, count=len(values)
+                    )
+                    seen_ids.update(values)
+                    logger.info(
+                        f"Removed {repeated.sum()} records duplicated in earlier chunks"
+                    )
+                    
+                    clean_data = self.transform(chunk[~repeated])
+                    self._write_rows(conn, clean_data, target_table)
+                    records += len(clean_data)
+        finally:
+            # Release the reader and discard a partial Parquet copy right away
+            chunks.close()
+        
+        logger.info(f"Successfully loaded {records} records to '{target_table}'")
+        return records
+    
+    def _iter_csv_chunks(self, source_path: str) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV source chunk by chunk, with the same dtypes as extract.
+        
+        With fast_io, chunks come from the Parquet copy of the CSV when it is
+        fresh; otherwise Arrow batches are streamed from the CSV and written
+        to a new Parquet copy along the way.
+        
+        Args:
+            source_path: Path to the source CSV file
+        
+        Returns:
+            Iterator of raw DataFrame chunks
+        """
+        columns = self.config.get('columns')
+        fast_io = pacsv is not None and self.config.get('fast_io', True)
+        
+        if not fast_io:
+            yield from pd.read_csv(
+                source_path,
+                dtype=COLUMN_DTYPES,
+                parse_dates=['date'],
+                usecols=columns,
+                chunksize=STREAM_CHUNK_ROWS
+            )
+            return
+        
+        cache_path = source_path + '.parquet'
+        if self._cache_is_fresh(source_path, cache_path):
+            logger.info(f"Reading cached Parquet copy {cache_path}")
+            batches = pq.ParquetFile(cache_path).iter_batches(
+                batch_size=STREAM_CHUNK_ROWS, columns=columns
+            )
+            for batch in batches:
+                yield _arrow_to_pandas(pa.Table.from_batches([batch]))
+            return
+        
+        read_options, convert_options = self._arrow_csv_options()
+        reader = pacsv.open_csv(
+            source_path,
+            read_options=read_options,
+            convert_options=convert_options
+        )
+        
+        # Build the Parquet copy under a temporary name; it only replaces the
+        # cache once the whole file has been read. Cache failures are logged
+        # and never interrupt the load.
+        tmp_path = cache_path + '.tmp'
+        writer = None
+        
+        def drop_cache(error: Optional[Exception] = None) -> None:
+            nonlocal writer
+            if error is not None:
+                logger.warning(f"Could not write Parquet cache {cache_path}: {str(error)}")
+            if writer is not None:
+                try:
+                    writer.close()
+                except Exception:
+                    pass
+                writer = None
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        try:
+            writer = pq.ParquetWriter(tmp_path, reader.schema)
+        except Exception as e:
+            drop_cache(e)
+        
+        try:
+            for batch in reader:
+                if writer is not None:
+                    try:
+                        writer.write_batch(batch)
+                    except Exception as e:
+                        drop_cache(e)
+                
+                df = _arrow_to_pandas(pa.Table.from_batches([batch]))
+                yield df[columns] if columns else df
+            
+            if writer is not None:
+                try:
+                    writer.close()
+                    writer = None
+                    os.replace(tmp_path, cache_path)
+                except Exception as e:
+                    drop_cache(e)
+        finally:
+            # Stopped early (failed load or read): discard the partial copy
+            drop_cache()
+    
     def validate_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Perform data quality validation.
@@ -269,10 +910,15 @@ class RetailETLPipeline:
         Returns:
             Dictionary containing validation results
         """
+        # Hash only the key column when present instead of every column
+        key_columns = ['transaction_id'] if 'transaction_id' in df.columns else None
+        null_counts = df.isna().sum(axis=0)
+        duplicate_count = int(df.duplicated(subset=key_columns, keep='first').sum())
+        
         validation_results = {
             'total_records': len(df),
-            'missing_values': df.isnull().sum().to_dict(),
-            'duplicate_records': df.duplicated().sum(),
+            'missing_values': null_counts.to_dict(),
+            'duplicate_records': duplicate_count,
             'columns': list(df.columns),
             'data_types': df.dtypes.to_dict()
         }